@@ -1,5 +1,19 @@
 import re
-from typing import Callable, Generator
+from typing import Callable, Generator, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, used only by sum_profit_bulk
+    np = None
+
+_NUMBER_RE = re.compile(r"\b\d+\.\d+\b")
+
+# Alternatives are tried left to right, so longer forms come first
+_TOKEN_RE = re.compile(
+    r"(?P<date>\b\d{4}-\d{2}-\d{2}\b)"
+    r"|(?P<float>\b\d+\.\d+\b)"
+    r"|(?P<int>\b\d+\b)"
+)
 
 def generator_numbers(text: str) -> Generator[float, None, None]:
     """
@@ -14,9 +28,56 @@ def generator_numbers(text: str) -> Generator[float, None, None]:
         Yields:
             float: Each detected floating-point number found in the text.
     """
-    pattern = r"\b\d+\.\d+\b"
-    for match in re.finditer(pattern, text):
-        yield float(match.group())
+    for match in _NUMBER_RE.finditer(text):
+        yield float(match.group(0))
+
+def generator_tokens(text: str) -> Generator[Tuple[str, str], None, None]:
+    """
+        Extracts dates, floating-point and integer numbers from the text.
+
+        All kinds are found in a single scan with one combined pattern,
+        so adding a new kind does not add another pass over the text.
+
+        Args:
+            text (str): The input text containing potential numeric values.
+
+        Yields:
+            Tuple[str, str]: The token kind ("date", "float" or "int")
+                and the matched text.
+    """
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        yield kind, match.group(kind)
+
+def _sum_numbers_fast(text: str) -> float:
+    """
+        Sums all floating-point numbers in the text without
+        going through a Python-level generator.
+    """
+    return sum(map(float, _NUMBER_RE.findall(text)))
+
+def sum_profit_bulk(text: str) -> float:
+    """
+       Calculates the total sum of all floating-point numbers
+       in a large text using NumPy for parsing and summation.
+
+       Holds one list of matched strings and one float64 array
+       in memory at once, so it trades RAM for speed. Falls back
+       to the pure-Python path when NumPy is not installed.
+
+       Args:
+           text (str): The input text containing numeric values.
+
+       Returns:
+           float: The total sum of all extracted numbers.
+       """
+    matches = _NUMBER_RE.findall(text)
+    if not matches:
+        return 0.0
+
+    if np is None:
+        return sum(map(float, matches))
+    return float(np.asarray(matches, dtype=np.float64).sum())
 
 def sum_profit(text: str, generator_func: Callable[[str], Generator[float, None, None]]) -> float:
     """
@@ -34,6 +95,8 @@ def sum_profit(text: str, generator_func: Callable[[str], Generator[float, None,
        Returns:
            float: The total sum of all extracted numbers.
        """
+    if generator_func is generator_numbers:
+        return _sum_numbers_fast(text)
     return sum(generator_func(text))
 
 if __name__ == "__main__":
@@ -1,8 +1,8 @@
 import sys
-from typing import List, Dict,TypedDict
+from typing import List, Dict, Iterable, Iterator, NamedTuple
 from collections import Counter
 
-class LogEntry(TypedDict):
+class LogEntry(NamedTuple):
     date: str
     time: str
     level: str
@@ -12,36 +12,30 @@ class LogEntry(TypedDict):
 LogList = List[LogEntry]
 LogCounts = Dict[str, int]
 
+LOG_READ_BUFFER = 1 << 20  # 1 MiB read buffer for large log files
+
 def parse_log_line(line: str) -> LogEntry:
     """
     Parses a log line into components:
     date, time, level, message.
     """
-    parts = line.strip().split(maxsplit=3)
+    parts = line.split(None, 3)
 
     if len(parts) < 4:
         raise ValueError(f"Invalid log format: {line}")
 
     date, time, level, message = parts
+    message = message.rstrip()
 
-    return LogEntry(
-        date=date,
-        time=time,
-        level=level,
-        message=message
-    )
+    return LogEntry(date, time, sys.intern(level), message)
 
-def load_logs(file_path: str) -> LogList:
+def _iter_lines(file_path: str) -> Iterator[bytes]:
     """
-    Loads and parses log file.
+    Yields raw undecoded lines of the log file.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            return [
-                parse_log_line(line)
-                for line in file
-                if line.strip()
-            ]
+        with open(file_path, "rb", buffering=LOG_READ_BUFFER) as file:
+            yield from file
 
     except FileNotFoundError:
         raise FileNotFoundError(f"File '{file_path}' not found.")
@@ -52,26 +46,72 @@ def load_logs(file_path: str) -> LogList:
     except OSError as e:
         raise OSError(f"File error: {e}")
 
-def filter_logs_by_level(logs: LogList, level: str) -> LogList:
+def _iter_logs(file_path: str) -> Iterator[LogEntry]:
+    """
+    Lazily parses log file line by line.
+    """
+    for raw in _iter_lines(file_path):
+        if raw.strip():
+            yield parse_log_line(raw.decode("utf-8"))
+
+def _iter_filtered(file_path: str, level: str) -> Iterator[LogEntry]:
+    """
+    Lazily parses only the lines that may belong to the given level.
+
+    The raw bytes are checked for the level text first, so lines
+    that cannot contain it are never decoded or parsed. Callers
+    still need to match the level exactly, as the text can also
+    appear inside a message or another level name.
+    """
+    needle = level.upper().encode("utf-8")
+    for raw in _iter_lines(file_path):
+        if needle in raw and raw.strip():
+            yield parse_log_line(raw.decode("utf-8"))
+
+def load_logs(file_path: str) -> LogList:
+    """
+    Loads and parses log file.
+    """
+    return list(_iter_logs(file_path))
+
+def filter_logs_by_level(logs: Iterable[LogEntry], level: str) -> LogList:
     """
         Filters logs by logging level.
     """
-    level = level.upper()
-    return [log for log in logs if log["level"] == level]
-    # or different approach can be:
-    return list(filter(lambda log: log["level"] == level, logs))
+    level = sys.intern(level.upper())
+    return [log for log in logs if log.level == level]
 
-def count_logs_by_level(logs: LogList) -> Counter[str]:
+def count_logs_by_level(logs: Iterable[LogEntry]) -> Counter[str]:
     """
        Counts logs grouped by level using Counter.
      """
-    return Counter(log["level"] for log in logs)
+    return Counter(log.level for log in logs)
+
+def _iter_raw_levels(file_path: str) -> Iterator[bytes]:
+    """
+    Yields the undecoded level token of every non-blank log line.
+    """
+    for raw in _iter_lines(file_path):
+        parts = raw.split(None, 3)
+        if not parts:
+            continue
+        if len(parts) < 4:
+            raise ValueError(f"Invalid log format: {raw.decode('utf-8', 'replace')}")
+        yield parts[2]
+
+def count_levels_from_file(file_path: str) -> Counter[str]:
+    """
+    Counts logs grouped by level straight from the file,
+    without decoding lines or building LogEntry objects.
+    """
+    counts = Counter(_iter_raw_levels(file_path))
+    return Counter({level.decode("utf-8"): count for level, count in counts.items()})
 
 def calculate_level_width(counts: LogCounts, header: str) -> int:
     """
     Calculates the width of the 'level' column dynamically.
     """
-    longest_level = max((len(level) for level in counts), default=0)
+    longest_level = max(map(len, counts), default=0)
     return max(len(header), longest_level)
 
 
@@ -87,8 +127,9 @@ def print_table_rows(counts: LogCounts, level_width: int) -> None:
     """
     Prints table rows with sorted log levels.
     """
-    for level in sorted(counts):
-        print(f"{level:<{level_width}} | {counts[level]}")
+    rows = [f"{level:<{level_width}} | {counts[level]}" for level in sorted(counts)]
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
 
 def display_log_counts(counts: LogCounts)-> None:
     """
@@ -113,8 +154,8 @@ def display_filtered_logs(logs: LogList, level: str) -> None:
 
     print(f"\nДеталі логів для рівня '{level}':")
 
-    for log in logs:
-        print(f"{log['date']} {log['time']} - {log['message']}")
+    lines = [f"{log.date} {log.time} - {log.message}" for log in logs]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main() -> None:
     if len(sys.argv) < 2:
@@ -124,18 +165,19 @@ def main() -> None:
     file_path = sys.argv[1]
 
     try:
-        logs = load_logs(file_path)
+        if len(sys.argv) == 3:
+            level = sys.argv[2]
+            filtered = filter_logs_by_level(_iter_filtered(file_path, level), level)
+        else:
+            counts = count_levels_from_file(file_path)
 
     except (FileNotFoundError, PermissionError, OSError) as e:
         print(f"Error: {e}")
         sys.exit(1)
 
     if len(sys.argv) == 3:
-        level = sys.argv[2]
-        filtered = filter_logs_by_level(logs, level)
         display_filtered_logs(filtered, level)
     else:
-        counts = count_logs_by_level(logs)
         display_log_counts(counts)
 
 
@@ -1,74 +1,64 @@
-from typing import Tuple, List, Dict
+import re
+import sys
+from bisect import insort
+from functools import lru_cache
+from typing import Tuple, List, Dict, Optional
 
+EXIT = object()  # Sentinel returned by exit commands
 
-def input_error(func):
-    """
-    Decorator for handling user input errors.
-
-    Catches:
-    - ValueError
-    - KeyError
-    - IndexError
+_PHONE_RE = re.compile(r"\A\d{10}\Z", re.ASCII)
 
-    Returns appropriate user-friendly messages
-    without stopping program execution.
-    """
-    def inner(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except KeyError:
-            return "Contact not found."
-        except IndexError:
-            return "Enter the required arguments for this command."
-        except ValueError as e:
-            return str(e) if str(e) else "Invalid input."
-    return inner
 
-def parse_input(user_input: str) -> Tuple[str, ...]:
+@lru_cache(maxsize=64)
+def parse_input(user_input: str) -> Tuple[str, Tuple[str, ...]]:
     """
     Parses raw user input into a command and its arguments.
 
     The input string is split by whitespace.
     The first word is treated as the command (converted to lowercase),
-    and the remaining words are returned as unpacked arguments.
+    and the remaining words are returned as a tuple of arguments.
+    Results are cached, so repeated commands skip the parsing.
 
     Args:
         user_input (str): The raw input string entered by the user.
 
     Returns:
-        Tuple[str, ...]:
+        Tuple[str, Tuple[str, ...]]:
             A tuple where:
             - the first element is the command (str),
-            - the remaining elements are arguments (str).
+            - the second element is the tuple of arguments.
+            Empty input yields an empty command and no arguments.
 
     Example:
         Input:  "add John 1234567890"
-        Output: ("add", "John", "1234567890")
+        Output: ("add", ("John", "1234567890"))
     """
-    cmd, *args = user_input.split()
-    cmd = cmd.strip().lower()
-    return cmd, *args
+    parts = user_input.split()
+    if not parts:
+        return "", ()
+    return parts[0].lower(), tuple(parts[1:])
 
 
-def validate_phone(phone: str) -> None:
+def _validate_phone(phone: str) -> Optional[str]:
     """
-    Raises ValueError if phone is invalid.
+    Returns an error message if phone is invalid, otherwise None.
     """
-    if not phone.isdigit():
-        raise ValueError("Wrong phone format. It must contain only digits.")
+    if not _PHONE_RE.match(phone):
+        return "Wrong phone format. It must contain exactly 10 digits."
+
+    return None
 
-    if len(phone) != 10:
-        raise ValueError("Wrong phone format. It must contain 10 digits.")
 
-@input_error
-def add_contact(args: List[str], contacts: Dict[str, str]) -> str:
+def add_contact(args: Tuple[str, ...], contacts: Dict[str, str], sorted_names: List[str]) -> str:
     """
     Adds a new contact to the contacts dictionary.
 
     Args:
-        args (List[str]): A list containing [name, phone].
+        args (Tuple[str, ...]): A tuple containing (name, phone).
         contacts (Dict[str, str]): Dictionary storing contacts
                                    in the format {name: phone}.
+        sorted_names (List[str]): Alphabetically sorted contact names,
+                                  kept in sync with contacts.
 
     Returns:
         str:
@@ -76,20 +66,24 @@ def add_contact(args: List[str], contacts: Dict[str, str]) -> str:
             - Error message if arguments are invalid or phone is incorrect.
     """
     if len(args) != 2:
-        raise ValueError("Give me name and phone please.")
+        return "Give me name and phone please."
 
-    name, phone = args  #  IndexError
-    validate_phone(phone) #  ValueError
+    name, phone = args
+    error = _validate_phone(phone)
+    if error:
+        return error
+
+    if name not in contacts:
+        insort(sorted_names, name)
     contacts[name] = phone
     return "Contact added."
 
-@input_error
-def change_contact(args: List[str], contacts: Dict[str, str]) -> str:
+def change_contact(args: Tuple[str, ...], contacts: Dict[str, str]) -> str:
     """
     Updates the phone number of an existing contact.
 
     Args:
-        args (List[str]): A list containing [name, new_phone].
+        args (Tuple[str, ...]): A tuple containing (name, new_phone).
         contacts (Dict[str, str]): Dictionary storing contacts.
 
     Returns:
@@ -98,24 +92,26 @@ def change_contact(args: List[str], contacts: Dict[str, str]) -> str:
             - Error message if contact does not exist or input is invalid.
     """
     if len(args) != 2:
-        raise ValueError("Give me name and new phone please.")
+        return "Give me name and new phone please."
 
-    name, phone = args #  IndexError
+    name, phone = args
 
     if name not in contacts:
-        raise KeyError #  KeyError
+        return "Contact not found."
+
+    error = _validate_phone(phone)
+    if error:
+        return error
 
-    validate_phone(phone) #  ValueError
     contacts[name] = phone
     return "Contact updated."
 
-@input_error
-def show_phone(args: List[str], contacts: Dict[str, str]) -> str:
+def show_phone(args: Tuple[str, ...], contacts: Dict[str, str]) -> str:
     """
     Retrieves the phone number for a specific contact.
 
     Args:
-        args (List[str]): A list containing [name].
+        args (Tuple[str, ...]): A tuple containing (name,).
         contacts (Dict[str, str]): Dictionary storing contacts.
 
     Returns:
@@ -124,20 +120,24 @@ def show_phone(args: List[str], contacts: Dict[str, str]) -> str:
             - Error message if contact does not exist or arguments are invalid.
     """
     if len(args) != 1:
-        raise ValueError("Enter user name.")  # ValueError
+        return "Enter user name."
+
+    name = args[0]
+    phone = contacts.get(name)
+    if phone is None:
+        return "Contact not found."
 
-    name = args[0] # IndexError
-    return f"{name}: {contacts[name]}" # KeyError
+    return f"{name}: {phone}"
 
-@input_error
-def show_all(contacts: Dict[str, str]) -> str:
+def show_all(contacts: Dict[str, str], sorted_names: List[str]) -> str:
     """
     Returns a formatted string containing all saved contacts.
 
-    Contacts are sorted alphabetically by name.
+    Contacts are listed alphabetically by name.
 
     Args:
         contacts (Dict[str, str]): Dictionary storing contacts.
+        sorted_names (List[str]): Alphabetically sorted contact names.
 
     Returns:
         str:
@@ -147,10 +147,10 @@ def show_all(contacts: Dict[str, str]) -> str:
     if not contacts:
         return "No contacts found."
 
-    return "\n".join(
-        f"{name}: {phone}"
-        for name, phone in sorted(contacts.items())
-    )
+    return "\n".join([
+        f"{name}: {contacts[name]}"
+        for name in sorted_names
+    ])
 
 
 def show_help() -> str:
@@ -180,32 +180,42 @@ def main():
     an interactive command loop until the user exits.
     """
     contacts: Dict[str, str] = {}
+    sorted_names: List[str] = []
+    interactive = sys.stdin.isatty()
 
     commands = {
         "hello": lambda args: "How can I help you?",
-        "add": lambda args: add_contact(args, contacts),
+        "add": lambda args: add_contact(args, contacts, sorted_names),
         "change": lambda args: change_contact(args, contacts),
         "phone": lambda args: show_phone(args, contacts),
-        "all": lambda args: show_all(contacts),
+        "all": lambda args: show_all(contacts, sorted_names),
         "help": lambda args: show_help(),
+        "close": lambda args: EXIT,
+        "exit": lambda args: EXIT,
     }
 
     print("Welcome to the assistant bot!")
     print(show_help())
 
     while True:
-        user_input = input("Enter a command: ")
-        command, *args = parse_input(user_input)
-
-        if command in ["close", "exit"]:
-            print("Good bye!")
+        user_input = input("Enter a command: ") if interactive else sys.stdin.readline()
+        if not interactive and not user_input:  # EOF on piped input
             break
 
-        if command in commands:
-            print(commands[command](args))
-        else:
+        command, args = parse_input(user_input)
+
+        handler = commands.get(command)
+        if handler is None:
             print("Invalid command. Please use one of the following commands:")
             print(show_help())
+            continue
+
+        result = handler(args)
+        if result is EXIT:
+            print("Good bye!")
+            break
+
+        print(result)
 
 if __name__ == "__main__":
     main()